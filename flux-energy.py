@@ -1,11 +1,7 @@
 import argparse
 import typing
 
-import matplotlib.pyplot as plt
-
-from eprempy.paths import fullpath
 from support import interfaces
-from support import plots
 
 
 def main(
@@ -17,20 +13,47 @@ def main(
     **user
 ) -> None:
     """Create survey plots for one or more stream observers."""
+    import matplotlib.pyplot as plt
+    from eprempy.paths import fullpath
+    from support import plots
+    plots.configure_matplotlib(None if user.get('show') else 'Agg')
     streams = interfaces.get_streams(source, config, num)
     plotdir = fullpath(outdir or source or '.')
     plotdir.mkdir(parents=True, exist_ok=True)
+    if user.get('each_time'):
+        times = interfaces.split_indexer(user.get('time'))
+    else:
+        times = [user.get('time')]
+    if streams:
+        units = interfaces.get_units(user)
+        energies = streams[0].energies.withunit(units['energy'])
+    fig = None
     for stream in streams:
-        fig = plt.figure(figsize=(6, 6), layout='constrained')
-        ax = fig.gca()
-        plots.flux_energy(stream, user, axes=ax)
-        plotpath = plotdir / stream.source.with_suffix('.png').name
-        if verbose:
-            print(f"Saved {plotpath}")
-        plt.savefig(plotpath)
-        if user.get('show'):
-            plt.show()
-        plt.close()
+        for time in times:
+            if fig is None:
+                fig = plt.figure(figsize=(6, 6), layout='constrained')
+            ax = fig.gca()
+            ax.clear()
+            plots.flux_energy(
+                stream,
+                {**user, 'time': time},
+                axes=ax,
+                energies=energies,
+            )
+            if user.get('each_time') and time:
+                plotname = f"{stream.source.stem}-t{''.join(time)}.png"
+            else:
+                plotname = stream.source.with_suffix('.png').name
+            plotpath = plotdir / plotname
+            if verbose:
+                print(f"Saved {plotpath}")
+            fig.savefig(plotpath, **plots.get_savefig_kws(user))
+            if user.get('show'):
+                plt.show()
+                plt.close(fig)
+                fig = None
+    if fig is not None:
+        plt.close(fig)
 
 
 epilog = """
@@ -50,10 +73,26 @@ if __name__ == '__main__':
         help="time(s) at which to plot flux",
         nargs='*',
     )
+    parser.add_argument(
+        '--each-time',
+        help="create a separate plot for each time",
+        action='store_true',
+    )
     parser.add_argument(
         '--species',
         help="ion species to plot (symbol or index; default: 0)",
     )
+    parser.add_argument(
+        '--fast-png',
+        help="save PNG files with faster, lighter compression",
+        action='store_true',
+    )
+    parser.add_argument(
+        '--decimate',
+        help="maximum number of energies to plot in each spectrum",
+        type=interfaces.positive_int,
+        metavar='N',
+    )
     parser.add_argument(
         '--energy-unit',
         help="metric unit in which to display energies",
@@ -34,14 +34,6 @@ def main(
         plt.close()
 
 
-def get_streams(dataset: eprem.Dataset, num: typing.Optional[int]=None):
-    """Get all relevant stream observers."""
-    streams = dataset.streams
-    if isinstance(num, int):
-        return [streams[num]]
-    return list(streams.values())
-
-
 def get_ylims(user: dict):
     """Get the y-axis limits from user arguments."""
     return {
@@ -8,6 +8,7 @@ from matplotlib.axes import Axes
 from eprempy import eprem
 from eprempy import quantity
 from eprempy.paths import fullpath
+from support import interfaces
 
 
 def main(
@@ -22,7 +23,7 @@ def main(
     source = indir or '.'
     dataset = eprem.dataset(source=source, config=config)
     points = get_points(dataset, num)
-    species = get_species(user)
+    species = interfaces.get_species(user)
     plotdir = fullpath(outdir or source)
     plotdir.mkdir(parents=True, exist_ok=True)
     for point in points:
@@ -145,14 +146,6 @@ def make_suptitle(
     return f"{strloc} | {strspe}"
 
 
-def get_species(user: dict):
-    """Get the ion species to plot."""
-    species = user.get('species')
-    if species is not None: # allow value to be 0
-        return species
-    return 0
-
-
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(
         description=main.__doc__,
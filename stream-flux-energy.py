@@ -21,8 +21,12 @@ def main(
     streams = interfaces.get_streams(source, config, num)
     plotdir = fullpath(outdir or source or '.')
     plotdir.mkdir(parents=True, exist_ok=True)
+    times = interfaces.get_times(user)
+    locations = interfaces.get_locations(user)
+    species = interfaces.get_species(user)
+    units = interfaces.get_units(user)
     for stream in streams:
-        stream_flux(stream, user)
+        stream_flux(stream, times, locations, species, units, user)
         plotname = f"{stream.source.stem}-flux-energy.png"
         plotpath = plotdir / plotname
         if verbose:
@@ -35,16 +39,16 @@ def main(
 
 def stream_flux(
     stream: eprem.Stream,
+    times: typing.Union[typing.Tuple[int, ...], quantity.Measurement],
+    locations: typing.Union[typing.Tuple[int, ...], quantity.Measurement],
+    species: typing.Union[int, str],
+    units: typing.Dict[str, str],
     user: dict,
 ) -> None:
     """Plot the flux on a given stream."""
-    times = interfaces.get_times(user)
-    locations = interfaces.get_locations(user)
     ntimes = len(times)
     nlocations = len(locations)
-    units = {k: user.get(f'{k}_unit') or u for k, u in interfaces.UNITS.items()}
     flux = stream['flux'].withunit(units['flux'])
-    species = interfaces.get_species(user)
     arrays = flux[times, locations, species, :].squeezed
     energies = stream.energies.withunit(units['energy'])
     if ntimes == 1 and nlocations == 1:
@@ -1,12 +1,16 @@
 import argparse
+import concurrent.futures
+import functools
+import os
+import pathlib
 import typing
 
-import matplotlib.pyplot as plt
-
-from eprempy import eprem
-from eprempy.paths import fullpath
 from support import interfaces
-from support import plots
+
+if typing.TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+    from eprempy import eprem
 
 
 def main(
@@ -18,54 +22,144 @@ def main(
     **user
 ) -> None:
     """Create survey plots for one or more stream observers."""
-    streams = interfaces.get_streams(source, config, num)
+    panels = tuple(user.get('quantities') or ())
+    if not panels:
+        return
+    import matplotlib.pyplot as plt
+    from eprempy.paths import fullpath
+    from support import plots
+    plots.configure_matplotlib(None if user.get('show') else 'Agg')
     plotdir = fullpath(outdir or source or '.')
     plotdir.mkdir(parents=True, exist_ok=True)
-    for stream in streams:
-        plot_stream(stream, user)
-        plotpath = plotdir / stream.source.with_suffix('.png').name
-        if verbose:
-            print(f"Saved {plotpath}")
-        plt.savefig(plotpath)
-        if user.get('show'):
-            plt.show()
-        plt.close()
-
-
-def plot_stream(stream: eprem.Observer, user: dict):
-    """Create a survey plot for this stream."""
-    panels = user.get('quantities') or ()
-    npanels = len(panels)
-    if npanels == 0:
+    serial = isinstance(num, int) or user.get('show')
+    ids = [] if serial else interfaces.get_stream_ids(source)
+    if serial or len(ids) <= 1:
+        figure = None
+        for stream in interfaces.get_streams(source, config, num):
+            if figure is None:
+                figure = make_figure(panels)
+            plotpath = render_stream(*figure, stream, plotdir, user)
+            if verbose:
+                print(f"Saved {plotpath}")
+            if user.get('show'):
+                plt.show()
+                plt.close(figure[0])
+                figure = None
+        if figure is not None:
+            plt.close(figure[0])
         return
-    width = sum(v['width'] for k, v in PANELS.items() if k in panels)
+    render = functools.partial(
+        _render_one,
+        source=source,
+        config=config,
+        plotdir=plotdir,
+        user=user,
+    )
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=min(os.cpu_count() or 1, len(ids)),
+        initializer=_init_worker,
+        initargs=(panels,),
+    ) as executor:
+        for plotpath in executor.map(render, ids):
+            if verbose:
+                print(f"Saved {plotpath}")
+
+
+_worker_figure = None
+"""The reusable survey figure and axes of a worker process."""
+
+
+def _init_worker(panels: typing.Tuple[str, ...]) -> None:
+    """Prepare a worker process to create survey plots."""
+    global _worker_figure
+    from support import plots
+    plots.configure_matplotlib('Agg')
+    _worker_figure = make_figure(panels)
+
+
+def _render_one(
+    num: int,
+    source: typing.Optional[str],
+    config: typing.Optional[str],
+    plotdir: pathlib.Path,
+    user: dict,
+) -> pathlib.Path:
+    """Create and save the survey plot for one stream in a worker process.
+
+    This function opens its own stream observer so that the parent process
+    does not need to pickle observer interfaces.
+    """
+    from eprempy import eprem
+    stream = eprem.stream(num, config=config, source=source)
+    return render_stream(*_worker_figure, stream, plotdir, user)
+
+
+def render_stream(
+    fig: 'Figure',
+    axs: typing.Sequence['Axes'],
+    stream: 'eprem.Observer',
+    plotdir: pathlib.Path,
+    user: dict,
+) -> pathlib.Path:
+    """Create and save the survey plot for this stream."""
+    from support import plots
+    plot_stream(fig, axs, stream, user)
+    plotpath = plotdir / stream.source.with_suffix('.png').name
+    fig.savefig(plotpath, **plots.get_savefig_kws(user))
+    return plotpath
+
+
+def make_figure(
+    panels: typing.Sequence[str],
+) -> typing.Tuple['Figure', typing.Sequence['Axes']]:
+    """Create a figure with one set of axes for each survey panel."""
+    import matplotlib.pyplot as plt
+    available = get_panels()
+    width = sum(available[k]['width'] for k in panels)
     fig, axs = plt.subplots(
         nrows=1,
         ncols=len(panels),
-        squeeze=True,
+        squeeze=False,
         figsize=(width, 6),
         layout='constrained',
     )
-    for ax, k in zip((axs if npanels > 1 else [axs]), panels):
-        PANELS[k]['plotter'](stream, user, axes=ax)
+    return fig, axs[0]
+
+
+def plot_stream(
+    fig: 'Figure',
+    axs: typing.Sequence['Axes'],
+    stream: 'eprem.Observer',
+    user: dict,
+) -> None:
+    """Draw a survey plot for this stream on existing axes."""
+    from support import plots
+    panels = user.get('quantities') or ()
+    available = get_panels()
+    for ax, k in zip(axs, panels):
+        ax.clear()
+        available[k]['plotter'](stream, user, axes=ax)
     title = plots.make_title(stream, user, ['location', 'species'])
     fig.suptitle(title, fontsize=20)
 
 
-PANELS = {
-    'flux': {
-        'width': 10,
-        'plotter': plots.flux_time,
-    },
-    'fluence': {
-        'width': 5,
-        'plotter': plots.fluence_energy,
-    },
-    'intflux': {
-        'width': 5,
-        'plotter': plots.intflux_time,
-    },
-}
+def get_panels() -> typing.Dict[str, dict]:
+    """Get the width and plotting function of each survey panel."""
+    from support import plots
+    return {
+        'flux': {
+            'width': 10,
+            'plotter': plots.flux_time,
+        },
+        'fluence': {
+            'width': 5,
+            'plotter': plots.fluence_energy,
+        },
+        'intflux': {
+            'width': 5,
+            'plotter': plots.intflux_time,
+        },
+    }
 
 
 epilog = """
@@ -125,6 +219,17 @@ if __name__ == '__main__':
         '--energy-unit',
         help="metric unit in which to display energies",
     )
+    parser.add_argument(
+        '--fast-png',
+        help="save PNG files with faster, lighter compression",
+        action='store_true',
+    )
+    parser.add_argument(
+        '--decimate',
+        help="maximum number of energies to plot in each spectrum",
+        type=interfaces.positive_int,
+        metavar='N',
+    )
     parser.add_argument(
         '-v', '--verbose',
         help="print runtime messages",
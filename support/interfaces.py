@@ -3,13 +3,14 @@ Command-line support for EPREM analysis programs.
 """
 
 import argparse
+import functools
+import os
 import pathlib
 import textwrap
 import typing
 
-from eprempy import eprem
-from eprempy import quantity
-from eprempy.paths import fullpath
+if typing.TYPE_CHECKING:
+    from eprempy import eprem
 
 
 class ConvertStreamIDs(argparse.Action):
@@ -74,6 +75,16 @@ def split_key_value_pairs(
     return target
 
 
+def positive_int(string: str) -> int:
+    """Convert a string from the CLI to a positive integer."""
+    value = int(string)
+    if value < 1:
+        raise argparse.ArgumentTypeError(
+            f"{string!r} is not a positive integer"
+        ) from None
+    return value
+
+
 def parse_plot_kws(string: str) -> typing.Dict[str, typing.Any]:
     """Parse plot-related key-value pairs from CLI."""
     if not string:
@@ -86,10 +97,14 @@ def parse_plot_kws(string: str) -> typing.Dict[str, typing.Any]:
     return result
 
 
+_GLOB_CHARS = frozenset('*?[')
+"""Characters that mark a run name as a globbing pattern."""
+
+
 def build_paths(
     indir: str=None,
     runs: typing.Union[str, typing.Iterable[str]]=None,
-) -> typing.Tuple[pathlib.Path]:
+) -> typing.Tuple[pathlib.Path, ...]:
     """Convert user input into full paths.
 
     Parameters
@@ -100,36 +115,84 @@ def build_paths(
     runs : string or iterable of strings, optional
         The name of a simulation run or a globbing pattern representing multiple
         simulation runs.
+
+    Notes
+    -----
+    This function caches its results by argument values and current working
+    directory, so repeated calls do not touch the file system. Call
+    `build_paths.cache_clear()` to see runs created after a previous call.
     """
+    if runs is not None and not isinstance(runs, str):
+        runs = tuple(runs)
+    return _build_paths(pathlib.Path.cwd(), indir, runs)
+
+
+@functools.lru_cache(maxsize=64)
+def _build_paths(
+    cwd: pathlib.Path,
+    indir: typing.Optional[str],
+    runs: typing.Union[str, typing.Tuple[str, ...], None],
+) -> typing.Tuple[pathlib.Path, ...]:
+    """Compute the full paths for `build_paths`."""
+    from eprempy.paths import fullpath
     if runs is None and indir is None:
-        return (pathlib.Path.cwd(),)
+        return (cwd,)
     if indir is None:
         if isinstance(runs, str):
-            return (fullpath(run) for run in pathlib.Path.cwd().glob(runs))
+            if not _GLOB_CHARS & set(runs):
+                return (fullpath(runs),)
+            return tuple(cwd.glob(runs))
         return tuple(fullpath(run) for run in runs)
     path = fullpath(indir)
     if runs is None:
-        contents = tuple(path.glob('*'))
-        if path.is_dir() and all(p.is_dir() for p in contents):
-            return contents
-        return (path,)
+        if not path.is_dir():
+            return (path,)
+        contents = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    return (path,)
+                contents.append(pathlib.Path(entry.path))
+        return tuple(contents)
     if len(runs) == 1:
-        return tuple(path / run for run in path.glob(runs[0]))
+        if not _GLOB_CHARS & set(runs[0]):
+            return (path / runs[0],)
+        return tuple(path.glob(runs[0]))
     return tuple(path / run for run in runs)
 
 
+build_paths.cache_clear = _build_paths.cache_clear
+
 
 def get_streams(
     source: typing.Optional[str]=None,
     config: typing.Optional[str]=None,
     num: typing.Optional[int]=None,
-) -> typing.List[eprem.Stream]:
+) -> typing.List['eprem.Stream']:
     """Get all relevant stream observers."""
-    dataset = eprem.dataset(source=source, config=config)
-    streams = dataset.streams
+    from eprempy import eprem
     if isinstance(num, int):
-        return [streams[num]]
-    return list(streams.values())
+        return [eprem.stream(num, config=config, source=source)]
+    dataset = eprem.dataset(source=source, config=config)
+    return list(dataset.streams.values())
+
+
+def get_stream_ids(source: typing.Optional[str]=None) -> typing.List[int]:
+    """Get the IDs of all stream observers without opening their files.
+
+    This function matches file names the same way as `eprem.Dataset.streams`.
+    """
+    from eprempy import datafile
+    from eprempy import eprem
+    from eprempy.paths import fullpath
+    directory = fullpath(source or '.', strict=True)
+    ids = set()
+    for prefix in eprem.Stream.prefixes:
+        for path in directory.glob(f"{prefix}*"):
+            key = path.stem[len(prefix):]
+            if path.suffix in datafile.VIEWERS and key.isdigit():
+                ids.add(int(key))
+    return sorted(ids)
 
 
 def get_time(user: dict):
@@ -163,12 +226,33 @@ def compute_indexer(args: typing.Union[typing.Sequence, None]):
     try:
         indices = [int(arg) for arg in args]
     except ValueError:
+        import numpy
+        from eprempy import quantity
         unit = args[-1]
-        values = [float(arg) for arg in args[:-1]]
+        values = numpy.fromiter(
+            args[:-1],
+            dtype=numpy.float64,
+            count=len(args) - 1,
+        )
         return quantity.measure(*values, unit)
     return tuple(indices)
 
 
+def split_indexer(args: typing.Union[typing.Sequence, None]):
+    """Split user input into single-valued indexer arguments.
+
+    The result contains one list of arguments for each value in `args`. If the
+    final member of `args` is a metric unit, each list will end with that unit.
+    """
+    if not args:
+        return [args]
+    try:
+        float(args[-1])
+    except ValueError:
+        return [[arg, args[-1]] for arg in args[:-1]]
+    return [[arg] for arg in args]
+
+
 def get_species(user: dict):
     """Get the ion species to plot."""
     species = user.get('species')
@@ -5,14 +5,35 @@ import numpy
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 
 from eprempy import Observable
 from eprempy import eprem
 from eprempy import measured
+from eprempy import physical
 from eprempy import quantity
 from . import interfaces
 
 
+RCPARAMS = {
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+}
+"""Matplotlib settings that reduce the cost of rendering long lines."""
+
+
+def configure_matplotlib(backend: typing.Optional[str]='Agg') -> None:
+    """Select the matplotlib backend and apply `RCPARAMS`.
+
+    If `backend` is null, this function will leave the backend unchanged.
+    """
+    if backend is not None:
+        mpl.use(backend)
+    mpl.rcParams.update(RCPARAMS)
+
+
 def flux_time(
     stream: eprem.Observer,
     user: dict,
@@ -53,60 +74,98 @@ def flux_energy(
     stream: eprem.Observer,
     user: dict,
     axes: typing.Optional[Axes]=None,
+    energies: typing.Optional[physical.Coordinates]=None,
 ) -> None:
-    """Create a plot of flux versus energy for this stream."""
+    """Create a plot of flux versus energy for this stream.
+
+    Callers that plot several streams from the same dataset may pass the
+    shared energy coordinates, in the display unit, as `energies`. This
+    function will raise a `ValueError` if the stream's energy grid has a
+    different number of values.
+    """
     times = interfaces.get_times(user)
     locations = interfaces.get_locations(user)
     species = interfaces.get_species(user)
     units = interfaces.get_units(user)
     flux = stream['flux'].withunit(units['flux'])
-    energies = stream.energies.withunit(units['energy'])
+    if energies is None:
+        energies = stream.energies.withunit(units['energy'])
+    xvalues = numpy.ascontiguousarray(energies, dtype=numpy.float64)
+    index = compute_decimation(len(xvalues), user.get('decimate'))
+    xvalues = xvalues[index]
     ax = axes or plt.gca()
-    cmap = mpl.colormaps['jet']
-    colors = cmap(numpy.linspace(0, 1, len(times)))
-    legend = False
     if len(times) > 1 and len(locations) > 1:
         raise ValueError
-    elif len(times) == 1 and len(locations) > 1:
-        colors = cmap(numpy.linspace(0, 1, len(locations)))
-        for i, location in enumerate(locations):
-            array = flux[times[0], location, species, :].squeezed
-            if isinstance(locations, measured.Object):
-                label = f"r = {float(location):.3f} {locations.unit}"
-            else:
-                label = f"shell = {int(location)}"
-            ax.plot(energies, array, label=label, color=colors[i])
+    values = numpy.asarray(
+        flux[times, locations, species, :],
+        dtype=numpy.float64,
+    )
+    if values.shape[-1] != len(energies):
+        raise ValueError(
+            f"The energy grid of {stream.source} has {values.shape[-1]}"
+            f" values but the shared energies have {len(energies)}"
+        )
+    arrays = numpy.ascontiguousarray(values.squeeze()[..., index])
+    labels = None
+    if len(times) == 1 and len(locations) > 1:
+        if isinstance(locations, measured.Object):
+            labels = [
+                f"r = {float(location):.3f} {locations.unit}"
+                for location in locations
+            ]
+        else:
+            labels = [f"shell = {int(location)}" for location in locations]
         ax.set_title(make_title(stream, user, ['time', 'species']))
-        legend = True
     elif len(times) > 1 and len(locations) == 1:
-        colors = cmap(numpy.linspace(0, 1, len(times)))
-        for i, time in enumerate(times):
-            array = flux[time, locations[0], species, :].squeezed
-            if isinstance(times, measured.Object):
-                label = f"t = {float(time):.1f} {times.unit}"
-            else:
-                label = f"time step {int(time)}"
-            ax.plot(energies, array, label=label, color=colors[i])
+        if isinstance(times, measured.Object):
+            labels = [f"t = {float(time):.1f} {times.unit}" for time in times]
+        else:
+            labels = [f"time step {int(time)}" for time in times]
         ax.set_title(make_title(stream, user, ['location', 'species']))
-        legend = True
     else:
-        array = flux[times[0], locations[0], species, :].squeezed
-        ax.plot(energies, array)
+        ax.plot(xvalues, arrays)
         ax.set_title(make_title(stream, user, ['time', 'location', 'species']))
+    if labels is not None:
+        colors = mpl.colormaps['jet'](numpy.linspace(0, 1, len(labels)))
+        handles = add_lines(ax, xvalues, arrays, colors, labels)
     if user.get('ylim'):
         ax.set_ylim(user['ylim'])
     ax.set_xlabel(f"Energy [{energies.unit}]", fontsize=14)
     ax.set_ylabel(fr"Flux [{flux.unit.format('tex')}]", fontsize=14)
     ax.set_xscale('log')
     ax.set_yscale('log')
-    if legend:
+    ax.autoscale_view()
+    if labels is not None:
         ax.legend(
+            handles=handles,
             loc='center left',
             bbox_to_anchor=(1.0, 0.5),
             handlelength=1.0,
         )
 
 
+def add_lines(
+    ax: Axes,
+    x: numpy.ndarray,
+    arrays: numpy.ndarray,
+    colors: typing.Sequence,
+    labels: typing.Sequence[str],
+) -> typing.List[Line2D]:
+    """Draw each row of `arrays` versus `x` as a single line collection.
+
+    A line collection draws all lines with one artist, which is much faster
+    than calling `ax.plot` once per line. Since a collection has only one
+    label, this function returns one proxy line per row for use as legend
+    handles.
+    """
+    segments = [numpy.column_stack((x, array)) for array in arrays]
+    ax.add_collection(LineCollection(segments, colors=colors))
+    return [
+        Line2D([], [], color=color, label=label)
+        for color, label in zip(colors, labels)
+    ]
+
+
 def fluence_energy(
     stream: eprem.Observer,
     user: dict,
@@ -118,9 +177,15 @@ def fluence_energy(
     units = interfaces.get_units(user)
     fluence = stream['fluence'].withunit(units['fluence'])
     energies = stream.energies.withunit(units['energy'])
-    array = fluence[-1, location, species, :].squeezed
+    xvalues = numpy.ascontiguousarray(energies, dtype=numpy.float64)
+    index = compute_decimation(len(xvalues), user.get('decimate'))
+    xvalues = xvalues[index]
+    array = numpy.ascontiguousarray(
+        fluence[-1, location, species, :].squeezed,
+        dtype=numpy.float64,
+    )[index]
     ax = axes or plt.gca()
-    ax.plot(energies, array)
+    ax.plot(xvalues, array)
     if user.get('ylim'):
         ax.set_ylim(user['ylim'])
     ax.set_xlabel(f"Energy [{energies.unit}]", fontsize=14)
@@ -164,6 +229,32 @@ def compute_yloglim(maxval):
     return 10**(ylogmax-6), 10**ylogmax
 
 
+def compute_decimation(
+    size: int,
+    target: typing.Optional[int]=None,
+) -> typing.Union[slice, numpy.ndarray]:
+    """Compute indices that select about `target` of `size` points.
+
+    The selected indices are logarithmically spaced, and always include the
+    first and last points, so that the decimated data retain their shape on a
+    logarithmic axis. This function therefore treats a `target` of 1 as 2. If
+    `target` is null or at least as large as `size`, this function will return
+    a slice that selects all points.
+    """
+    if not target or target >= size:
+        return slice(None)
+    count = max(target, 2)
+    indices = numpy.geomspace(1, size, count).round().astype(int) - 1
+    return numpy.unique(indices)
+
+
+def get_savefig_kws(user: dict) -> dict:
+    """Get keyword arguments for saving a figure from user input."""
+    if user.get('fast_png'):
+        return {'pil_kwargs': {'compress_level': 1, 'optimize': False}}
+    return {}
+
+
 def make_title(
     stream: eprem.Stream,
     user: dict,